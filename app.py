@@ -1,64 +1,300 @@
-import json
+import functools
+import hashlib
+import hmac
+import itertools
+import os
 import random
+import re
+import sqlite3
 import string
+import threading
+import time
+from dataclasses import astuple, dataclass
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+import pandas as pd
 import streamlit as st
 
 
 # ------------------ Core Banking Logic (No input(), UI-agnostic) ------------------ #
 
+ACCOUNT_NO_BATCH = 64   # candidate account numbers generated per RNG round
+PUBLIC_KEYS = ("name", "age", "email", "accountNo", "balance")  # fields safe to show in the UI
+TX_CACHE_SIZE = 128     # accounts whose (newest-first) history is kept in memory
+DETAILS_CACHE_SIZE = 1024  # verified (accountNo, PIN digest) -> details projections
+PIN_HASH_ROUNDS = 20_000  # PBKDF2 iterations; keeps one PIN check around 10 ms
+
+LETTERS = string.ascii_uppercase
+DIGITS = string.digits
+PIN_RE = re.compile(r"[0-9]{4}")  # used with fullmatch: exactly four ASCII digits
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    accountNo TEXT PRIMARY KEY,
+    name      TEXT NOT NULL,
+    age       INTEGER NOT NULL,
+    email     TEXT NOT NULL,
+    pin_hash  TEXT NOT NULL,
+    balance   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id            INTEGER PRIMARY KEY,
+    accountNo     TEXT NOT NULL,
+    time          TEXT NOT NULL,
+    type          TEXT NOT NULL,
+    amount        INTEGER NOT NULL,
+    balance_after INTEGER NOT NULL,
+    description   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_by_account ON transactions (accountNo, id);
+"""
+SCHEMA_VERSION = 1  # stored in PRAGMA user_version once any data.json import has committed
+ACCOUNT_COLUMNS = "name, age, email, pin_hash, accountNo, balance"  # Account field order
+TX_COLUMNS = ("time", "type", "amount", "balance_after", "description")
+INSERT_ACCOUNT = f"INSERT INTO accounts ({ACCOUNT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+INSERT_TX = f"INSERT INTO transactions (accountNo, {', '.join(TX_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+_iso_second = (0, "")  # (epoch second, its ISO string), reused by _now() within that second
+
+
+def _now():
+    global _iso_second
+    sec = int(time.time())
+    if _iso_second[0] != sec:
+        _iso_second = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _iso_second[1]
+
+
+def _hash_pin(pin: str, salt: bytes | None = None):
+    """Return a salted PBKDF2-SHA256 hash of the PIN as "salt$digest" (hex)."""
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", pin.encode(), salt, PIN_HASH_ROUNDS)
+    return f"{salt.hex()}${digest.hex()}"
+
+
+def _check_pin(pin: str, pin_hash: str):
+    salt, _ = pin_hash.split("$")
+    return hmac.compare_digest(_hash_pin(pin, bytes.fromhex(salt)), pin_hash)
+
+
+def _locked(method):
+    """Run a Bank method under the instance lock (the Bank is shared across sessions)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+_system_random = random.SystemRandom()  # OS CSPRNG behind the random API
+
+
+def _random_chars(alphabet: str, k: int):
+    """Return `k` characters drawn uniformly from `alphabet` using os.urandom."""
+    # bytes at or above the largest multiple of len(alphabet) are dropped, so
+    # `b % len(alphabet)` doesn't over-represent the first characters
+    limit = 256 - 256 % len(alphabet)
+    chars = []
+    while len(chars) < k:
+        chars += [alphabet[b % len(alphabet)] for b in os.urandom(k - len(chars)) if b < limit]
+    return chars
+
+
+def _trigrams(*texts: str):
+    return {t[i:i + 3] for t in texts for i in range(len(t) - 2)}
+
+
+@dataclass(slots=True)
+class Account:
+    # field names match the columns of the accounts table (and the old data.json keys)
+    name: str
+    age: int
+    email: str
+    pin_hash: str     # see _hash_pin; the PIN itself is never stored
+    accountNo: str
+    balance: int = 0
+
+
 class Bank:
-    def __init__(self, database: str = "data.json"):
+    def __init__(self, database: str = "bank.db", legacy_json: str = "data.json"):
         self.database = Path(database)
-        self.data = self._load()
+        self._lock = threading.Lock()
+
+        # one connection shared by every session; access is serialized by self._lock
+        self.conn = sqlite3.connect(self.database, check_same_thread=False)
+        # WAL with the default synchronous=FULL: every commit fsyncs the WAL, so a
+        # deposit or delete the UI has reported as done survives a power cut
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+        # in-memory mirror of the accounts table (insertion order = listing order)
+        self._by_acc: dict[str, Account] = {}
+        # numbers in the database or handed out by this process; the set skips
+        # them when generating new ones
+        self._used_accs: set[str] = set()
+        self._spare_accs: set[str] = set()
+        self._tx_cache: dict[str, list[dict]] = {}  # accountNo -> history, newest first
+        self._version = 0  # bumped on every mutation, used as a cache key by the UI
+        # get_details memo: a single last-viewed entry in front of a dict, both cleared
+        # on every mutation. Keys use an HMAC of the PIN under a per-process secret,
+        # so the PIN itself is not kept, and a wrong PIN never gets an entry.
+        self._pin_key = os.urandom(32)
+        self._last_details: tuple[tuple[str, bytes], dict] | None = None
+        self._details_cache: dict[tuple[str, bytes], dict] = {}
+
+        # search index: accountNo -> (order, name_lc, email_lc), plus trigram -> accountNos
+        self._search: dict[str, tuple[int, str, str]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+        self._order = itertools.count()
+
+        for row in self.conn.execute(f"SELECT {ACCOUNT_COLUMNS} FROM accounts ORDER BY rowid"):
+            self._add(Account(*row))
+
+        # user_version is set in the same transaction as the import, so an import
+        # that failed or was killed is simply retried on the next start
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            if not self._by_acc and Path(legacy_json).exists():
+                self._import_json(Path(legacy_json))
+            else:
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-    def _load(self):
-        if self.database.exists():
-            try:
-                return json.loads(self.database.read_text())
-            except Exception as err:
-                # If file is corrupted, start fresh
-                print(f"Error reading database: {err}")
-                return []
-        else:
-            return []
+    def _import_json(self, snapshot: Path):
+        """One-off import of the older data.json store (accounts with inline transactions).
 
-    def _save(self):
-        self.database.write_text(json.dumps(self.data, indent=2))
+        Any error is raised rather than skipped: nothing is committed and the
+        next start tries again. Once the import has committed the file is
+        removed, since it holds the PINs in plain text.
+        """
+        raw = snapshot.read_bytes()
+        try:
+            records = orjson.loads(raw) if raw.strip() else []
+        except orjson.JSONDecodeError as err:
+            raise ValueError(f"Could not import {snapshot}: {err}") from err
+
+        txs = {}
+        for r in records:
+            r = dict(r)
+            # accounts from before transaction history have no "transactions" key
+            txs[r["accountNo"]] = r.pop("transactions", [])
+            r["pin_hash"] = _hash_pin(r.pop("pin"))
+            self._add(Account(**r))
+
+        with self.conn:
+            self.conn.executemany(INSERT_ACCOUNT, (astuple(acc) for acc in self._by_acc.values()))
+            self.conn.executemany(
+                INSERT_TX,
+                ((no, *(tx[c] for c in TX_COLUMNS)) for no, history in txs.items() for tx in history),
+            )
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        try:
+            snapshot.unlink()
+        except OSError as err:
+            print(f"Could not remove {snapshot} after importing it: {err}")
+
+    def _write(self, *statements: tuple[str, tuple]):
+        """Run (sql, params) statements in one SQLite transaction.
+
+        A failed write is rolled back and reported as a ValueError like every
+        other error the UI shows; callers only update memory once this returns.
+        """
+        try:
+            with self.conn:  # commits on success, rolls back on error
+                for sql, params in statements:
+                    self.conn.execute(sql, params)
+        except sqlite3.Error as err:
+            print(f"Error writing database: {err}")
+            raise ValueError("Could not save the change, please try again.") from err
+
+    def _changed(self, account_no: str):
+        """Invalidate the caches after a committed change to `account_no`."""
+        self._version += 1
+        self._tx_cache.pop(account_no, None)
+        self._details_cache.clear()
+        self._last_details = None
+
+    def _add(self, acc: Account):
+        self._by_acc[acc.accountNo] = acc
+        self._used_accs.add(acc.accountNo)
+        self._index(acc)
+
+    def _index(self, acc: Account):
+        """Add (or refresh) an account's entry in the search index."""
+        old = self._unindex(acc.accountNo)
+        order = old[0] if old else next(self._order)
+        name, email = acc.name.lower(), acc.email.lower()
+
+        self._search[acc.accountNo] = (order, name, email)
+        for gram in _trigrams(name, email):
+            self._trigrams.setdefault(gram, set()).add(acc.accountNo)
+
+    def _unindex(self, account_no: str):
+        entry = self._search.pop(account_no, None)
+        if entry:
+            for gram in _trigrams(entry[1], entry[2]):
+                postings = self._trigrams[gram]
+                postings.discard(account_no)
+                if not postings:
+                    del self._trigrams[gram]
+        return entry
 
     def _generate_account_no(self):
         """Generate a random 10-character account number (5 letters + 5 digits)."""
         while True:
-            alpha = random.choices(string.ascii_uppercase, k=5)
-            num = random.choices(string.digits, k=5)
-            acc_id_list = alpha + num
-            random.shuffle(acc_id_list)
-            acc_no = "".join(acc_id_list)
+            if not self._spare_accs:
+                self._spare_accs = self._account_no_batch() - self._used_accs
+                continue
 
+            acc_no = self._spare_accs.pop()
             # make sure it's unique
-            if not any(a["accountNo"] == acc_no for a in self.data):
+            if acc_no not in self._used_accs:
+                self._used_accs.add(acc_no)
                 return acc_no
 
-    def _find_account(self, account_no: str, pin: str | None = None):
-        for acc in self.data:
-            if acc["accountNo"] == account_no and (pin is None or acc["pin"] == pin):
-                return acc
-        return None
-
-    def _add_transaction(self, acc: dict, tx_type: str, amount: int, description: str = ""):
-        """Append a transaction record to the account."""
-        if "transactions" not in acc or not isinstance(acc["transactions"], list):
-            acc["transactions"] = []
-
-        acc["transactions"].append({
-            "time": datetime.now().isoformat(timespec="seconds"),
-            "type": tx_type,
-            "amount": amount,
-            "balance_after": acc["balance"],
-            "description": description
-        })
+    @staticmethod
+    def _account_no_batch():
+        """Draw ACCOUNT_NO_BATCH candidates at once; leftovers are kept for later accounts."""
+        letters = _random_chars(LETTERS, 5 * ACCOUNT_NO_BATCH)
+        digits = _random_chars(DIGITS, 5 * ACCOUNT_NO_BATCH)
+
+        batch = set()
+        for i in range(0, 5 * ACCOUNT_NO_BATCH, 5):
+            acc_id_list = letters[i:i + 5] + digits[i:i + 5]
+            _system_random.shuffle(acc_id_list)
+            batch.add("".join(acc_id_list))
+        return batch
+
+    def _check_credentials(self, account_no: str, pin: str):
+        """Verify `pin` against the stored hash and return that hash.
+
+        Only the lookup holds the lock; the PBKDF2 check itself runs outside it
+        (pbkdf2_hmac releases the GIL), so one login doesn't stall every other
+        session. Callers re-take the lock and go through _verified_account().
+        """
+        with self._lock:
+            acc = self._by_acc.get(account_no)
+            pin_hash = acc.pin_hash if acc else None
+        if pin_hash is None or not _check_pin(pin, pin_hash):
+            raise ValueError("Invalid account number or PIN.")
+        return pin_hash
+
+    def _verified_account(self, account_no: str, pin_hash: str):
+        """Return the account checked by _check_credentials(); call with the lock held.
+
+        Fails if the account was deleted or its PIN changed in the meantime.
+        """
+        acc = self._by_acc.get(account_no)
+        if not acc or acc.pin_hash != pin_hash:
+            raise ValueError("Invalid account number or PIN.")
+        return acc
+
+    @staticmethod
+    def _transaction(account_no: str, tx_type: str, amount: int, balance_after: int, description: str):
+        """Return the INSERT statement recording one transaction for the account."""
+        return INSERT_TX, (account_no, _now(), tx_type, amount, balance_after, description)
 
     # ------------ Public methods used by UI ------------ #
 
@@ -66,129 +302,206 @@ class Bank:
         if age < 18:
             raise ValueError("Age must be 18 or above to create an account.")
 
-        if len(pin) != 4 or not pin.isdigit():
+        if not PIN_RE.fullmatch(pin):
             raise ValueError("PIN must be a 4-digit number.")
 
-        account_no = self._generate_account_no()
-        info = {
-            "name": name.strip(),
-            "age": age,
-            "email": email.strip(),
-            "pin": pin,          # store as string so leading zeros are preserved
-            "accountNo": account_no,
-            "balance": 0,
-            "transactions": []   # new: transaction history
-        }
+        # hash before taking the lock, see _check_credentials
+        pin_hash = _hash_pin(pin)
+        with self._lock:
+            acc = Account(name.strip(), age, email.strip(), pin_hash, self._generate_account_no())
 
-        # initial transaction (account created)
-        self._add_transaction(info, "ACCOUNT_CREATED", 0, "Account opened")
-
-        self.data.append(info)
-        self._save()
-        return info
+            # the account's history in the transactions table starts with an ACCOUNT_CREATED entry
+            self._write(
+                (INSERT_ACCOUNT, astuple(acc)),
+                self._transaction(acc.accountNo, "ACCOUNT_CREATED", 0, acc.balance, "Account opened"),
+            )
+            self._add(acc)
+            self._changed(acc.accountNo)
+            return self._public(acc)
 
     def deposit(self, account_no: str, pin: str, amount: int):
         if amount <= 0:
             raise ValueError("Deposit amount must be greater than 0.")
 
-        acc = self._find_account(account_no, pin)
-        if not acc:
-            raise ValueError("Invalid account number or PIN.")
-
-        acc["balance"] += amount
-        self._add_transaction(acc, "DEPOSIT", amount, "Amount deposited")
-        self._save()
-        return acc["balance"]
+        pin_hash = self._check_credentials(account_no, pin)
+        with self._lock:
+            acc = self._verified_account(account_no, pin_hash)
+            balance = acc.balance + amount
+            self._write(
+                ("UPDATE accounts SET balance = ? WHERE accountNo = ?", (balance, account_no)),
+                self._transaction(account_no, "DEPOSIT", amount, balance, "Amount deposited"),
+            )
+            acc.balance = balance
+            self._changed(account_no)
+            return balance
 
     def withdraw(self, account_no: str, pin: str, amount: int):
         if amount <= 0:
             raise ValueError("Withdrawal amount must be greater than 0.")
 
-        acc = self._find_account(account_no, pin)
-        if not acc:
-            raise ValueError("Invalid account number or PIN.")
-
-        if acc["balance"] < amount:
-            raise ValueError("Insufficient balance.")
-
-        acc["balance"] -= amount
-        self._add_transaction(acc, "WITHDRAW", amount, "Amount withdrawn")
-        self._save()
-        return acc["balance"]
+        pin_hash = self._check_credentials(account_no, pin)
+        with self._lock:
+            acc = self._verified_account(account_no, pin_hash)
+            # checked under the lock so a concurrent withdrawal can't overdraw
+            if acc.balance < amount:
+                raise ValueError("Insufficient balance.")
+
+            balance = acc.balance - amount
+            self._write(
+                ("UPDATE accounts SET balance = ? WHERE accountNo = ?", (balance, account_no)),
+                self._transaction(account_no, "WITHDRAW", amount, balance, "Amount withdrawn"),
+            )
+            acc.balance = balance
+            self._changed(account_no)
+            return balance
 
     def get_details(self, account_no: str, pin: str):
-        acc = self._find_account(account_no, pin)
-        if not acc:
-            raise ValueError("Invalid account number or PIN.")
-        # don't return PIN in UI
-        acc_copy = acc.copy()
-        acc_copy.pop("pin", None)
-        return acc_copy
+        key = (account_no, hmac.digest(self._pin_key, pin.encode(), "sha256"))
+        with self._lock:
+            # reruns of the same view hit the last entry and skip the PIN hash entirely
+            last = self._last_details
+            if last and last[0] == key:
+                return last[1]
+
+            details = self._details_cache.get(key)
+            if details is not None:
+                self._last_details = (key, details)
+                return details
+
+        pin_hash = self._check_credentials(account_no, pin)
+        with self._lock:
+            acc = self._verified_account(account_no, pin_hash)
+            # don't return PIN in UI
+            details = self._public(acc)
+
+            if len(self._details_cache) >= DETAILS_CACHE_SIZE:
+                del self._details_cache[next(iter(self._details_cache))]
+            self._details_cache[key] = details
+            self._last_details = (key, details)
+            return details
 
     def get_transactions(self, account_no: str, pin: str):
-        """Return list of transactions for an account."""
-        acc = self._find_account(account_no, pin)
-        if not acc:
-            raise ValueError("Invalid account number or PIN.")
-
-        # if no transactions key (old accounts), return empty list
-        txs = acc.get("transactions", [])
-        # Could sort by time if you want; currently order of insertion
-        return txs
+        """Return list of transactions for an account, newest first."""
+        pin_hash = self._check_credentials(account_no, pin)
+        with self._lock:
+            self._verified_account(account_no, pin_hash)
+
+            txs = self._tx_cache.get(account_no)
+            if txs is None:
+                # the (accountNo, id) index serves this newest-first without a sort
+                rows = self.conn.execute(
+                    f"SELECT {', '.join(TX_COLUMNS)} FROM transactions WHERE accountNo = ? ORDER BY id DESC",
+                    (account_no,),
+                )
+                txs = [dict(zip(TX_COLUMNS, row)) for row in rows]
+
+                if len(self._tx_cache) >= TX_CACHE_SIZE:
+                    del self._tx_cache[next(iter(self._tx_cache))]
+                self._tx_cache[account_no] = txs
+            return txs
 
     def update_details(self, account_no: str, pin: str, name=None, email=None, new_pin=None):
-        acc = self._find_account(account_no, pin)
-        if not acc:
-            raise ValueError("Invalid account number or PIN.")
+        pin_hash = self._check_credentials(account_no, pin)
 
-        changed_fields = []
+        changed = {}
         if name is not None and name.strip():
-            acc["name"] = name.strip()
-            changed_fields.append("name")
+            changed["name"] = name.strip()
         if email is not None and email.strip():
-            acc["email"] = email.strip()
-            changed_fields.append("email")
+            changed["email"] = email.strip()
         if new_pin is not None and new_pin.strip():
-            if len(new_pin) != 4 or not new_pin.isdigit():
+            if not PIN_RE.fullmatch(new_pin):
                 raise ValueError("New PIN must be a 4-digit number.")
-            acc["pin"] = new_pin
-            changed_fields.append("pin")
-
-        if changed_fields:
-            desc = "Updated: " + ", ".join(changed_fields)
-            self._add_transaction(acc, "ACCOUNT_UPDATE", 0, desc)
-
-        self._save()
+            # hash before taking the lock, see _check_credentials
+            changed["pin_hash"] = _hash_pin(new_pin)
+
+        with self._lock:
+            acc = self._verified_account(account_no, pin_hash)
+            if changed:
+                # keys are fixed column names, only the values come from the user
+                assignments = ", ".join(f"{field} = ?" for field in changed)
+                desc = "Updated: " + ", ".join(f.removesuffix("_hash") for f in changed)
+                self._write(
+                    (f"UPDATE accounts SET {assignments} WHERE accountNo = ?", (*changed.values(), account_no)),
+                    self._transaction(account_no, "ACCOUNT_UPDATE", 0, acc.balance, desc),
+                )
+                for field, value in changed.items():
+                    setattr(acc, field, value)
+                if "name" in changed or "email" in changed:
+                    self._index(acc)
+                self._changed(account_no)
         return True
 
     def delete_account(self, account_no: str, pin: str):
-        acc = self._find_account(account_no, pin)
-        if not acc:
-            raise ValueError("Invalid account number or PIN.")
-
-        self.data.remove(acc)
-        self._save()
+        pin_hash = self._check_credentials(account_no, pin)
+        with self._lock:
+            self._verified_account(account_no, pin_hash)
+            self._write(
+                ("DELETE FROM accounts WHERE accountNo = ?", (account_no,)),
+                ("DELETE FROM transactions WHERE accountNo = ?", (account_no,)),
+            )
+            del self._by_acc[account_no]
+            self._unindex(account_no)
+            self._changed(account_no)
         return True
 
+    @staticmethod
+    def _public(acc: Account):
+        # Don't expose pins; build the projection in one go instead of copy + pop
+        return {k: getattr(acc, k) for k in PUBLIC_KEYS}
+
+    @_locked
     def list_accounts(self):
-        # Don't expose pins or transactions in the listing
-        cleaned = []
-        for acc in self.data:
-            c = acc.copy()
-            c.pop("pin", None)
-            # optional: don't show full transactions in list view
-            c.pop("transactions", None)
-            cleaned.append(c)
-        return cleaned
+        return [self._public(acc) for acc in self._by_acc.values()]
+
+    @_locked
+    def search_accounts(self, query: str):
+        """Return listed accounts whose name or email contains `query` (case-insensitive)."""
+        q = query.strip().lower()
+        if len(q) < 3:
+            candidates = self._search
+        else:
+            # only accounts containing every trigram of the query can match
+            postings = sorted((self._trigrams.get(g, set()) for g in _trigrams(q)), key=len)
+            candidates = set.intersection(*postings)
+
+        matches = [
+            no for no in candidates
+            if q in self._search[no][1] or q in self._search[no][2]
+        ]
+        matches.sort(key=lambda no: self._search[no][0])
+        return [self._public(self._by_acc[no]) for no in matches]
 
 
 # ------------------ Streamlit UI ------------------ #
 
-# Initialize a shared Bank instance in session_state
-if "bank" not in st.session_state:
-    st.session_state.bank = Bank()
+# One Bank shared by every session and rerun, so the database is only loaded once
+@st.cache_resource
+def get_bank():
+    return Bank()
+
+
+bank: Bank = get_bank()
+
+
+# Streamlit reruns the whole script on every interaction, so memoize the
+# listing/search results until the bank's data actually changes. They are
+# kept as DataFrames, which st.dataframe ships to the browser as Arrow.
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_accounts(_bank: Bank, bank_id: int, version: int):
+    return pd.DataFrame(_bank.list_accounts(), columns=PUBLIC_KEYS)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_search(_bank: Bank, bank_id: int, version: int, query: str):
+    return pd.DataFrame(_bank.search_accounts(query), columns=PUBLIC_KEYS)
+
+
+# `_txs` comes from an authenticated get_transactions() call; the account's
+# rows only change along with the bank's version.
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_transactions(_txs: list, bank_id: int, version: int, account_no: str):
+    return pd.DataFrame(_txs, columns=TX_COLUMNS)
 
-bank: Bank = st.session_state.bank
 
 st.set_page_config(page_title="Central Bank", page_icon="🏦")
 st.title("🏦 Central Bank")
@@ -208,7 +521,7 @@ menu = st.sidebar.radio(
     ]
 )
 
-st.sidebar.info("All data is stored locally in `data.json`.")
+st.sidebar.info("All data is stored locally in `bank.db` (SQLite).")
 
 
 # --------- Create Account --------- #
@@ -228,7 +541,7 @@ if menu == "Create Account":
             st.success("Account created successfully! Please note down your account number.")
             st.code(f"Account Number: {acc['accountNo']}")
             st.subheader("Account Details")
-            st.json({k: v for k, v in acc.items() if k not in ["pin", "transactions"]})
+            st.json(acc)
         except ValueError as e:
             st.error(str(e))
 
@@ -298,14 +611,15 @@ elif menu == "Transaction History":
 
     if submitted:
         try:
+            # read before fetching so older rows are never cached under a newer version
+            version = bank._version
             txs = bank.get_transactions(acc_no, pin)
             if not txs:
                 st.info("No transactions found for this account.")
             else:
                 st.subheader("Transactions")
-                # Newest first (optional)
-                txs_sorted = sorted(txs, key=lambda x: x["time"], reverse=True)
-                st.dataframe(txs_sorted, use_container_width=True)
+                # already newest first
+                st.dataframe(cached_transactions(txs, id(bank), version, acc_no), width="stretch")
         except ValueError as e:
             st.error(str(e))
 
@@ -369,9 +683,9 @@ elif menu == "Delete Account":
 elif menu == "List All Accounts":
     st.header("All Accounts")
 
-    accounts = bank.list_accounts()
+    accounts = cached_accounts(bank, id(bank), bank._version)
 
-    if not accounts:
+    if accounts.empty:
         st.info("No accounts found.")
     else:
         st.subheader("Search")
@@ -381,17 +695,12 @@ elif menu == "List All Accounts":
         # Apply search filter
         filtered = accounts
         if query.strip():
-            q = query.strip().lower()
-            filtered = [
-                acc for acc in accounts
-                if q in acc.get("name", "").lower()
-                or q in acc.get("email", "").lower()
-            ]
+            filtered = cached_search(bank, id(bank), bank._version, query.strip())
 
         st.subheader("Results")
 
-        if not filtered:
+        if filtered.empty:
             st.info("No accounts match the current search.")
         else:
             st.write(f"Showing **{len(filtered)}** account(s).")
-            st.table(filtered)
+            st.dataframe(filtered, hide_index=True, width="stretch")